@@ -9,6 +9,13 @@ ensuring integrity between schema constraints and dynamic logic.
 
 from typing import Dict
 
+# (min key, max key, axis) per axis, built once instead of per validation
+_AXIS_KEYS = (
+    ("min_x", "max_x", "x"),
+    ("min_y", "max_y", "y"),
+    ("min_z", "max_z", "z"),
+)
+
 
 class DomainValidationError(Exception):
     """Custom exception raised when domain bounds are inconsistent."""
@@ -25,20 +32,22 @@ def validate_domain_bounds(domain: Dict) -> None:
     Expected Keys:
         min_x, max_x, min_y, max_y, min_z, max_z
     """
-    axes = ["x", "y", "z"]
-    for axis in axes:
-        min_val = domain.get(f"min_{axis}")
-        max_val = domain.get(f"max_{axis}")
+    for min_key, max_key, axis in _AXIS_KEYS:
+        min_val = domain.get(min_key)
+        max_val = domain.get(max_key)
         if min_val is None or max_val is None:
             raise DomainValidationError(f"Missing domain bounds for axis '{axis}'")
         try:
-            min_val = float(min_val)
-            max_val = float(max_val)
+            # JSON-parsed bounds are usually floats already; only coerce the rest
+            if not isinstance(min_val, float):
+                min_val = float(min_val)
+            if not isinstance(max_val, float):
+                max_val = float(max_val)
         except (TypeError, ValueError):
             raise DomainValidationError(f"Non-numeric bounds for axis '{axis}'")
         if max_val < min_val:
             raise DomainValidationError(
-                f"Invalid domain: max_{axis} ({max_val}) < min_{axis} ({min_val})"
+                f"Invalid domain: {max_key} ({max_val}) < {min_key} ({min_val})"
             )
 
 
@@ -30,29 +30,49 @@ def get_decimal_precision(resolution):
     """
     return max(0, len(str(resolution).split('.')[-1].rstrip('0')))
 
-def is_inside_model_geometry(corner, volume_tags, precision):
+def is_inside_model_geometry(corner, volume_tags, precision, cache=None, debug=False):
     """
     Returns True if the corner is inside any of the model's volumes.
     Applies resolution-based rounding to neutralize floating-point drift.
+
+    If a `cache` dict is given, results are memoized by rounded corner so
+    that corners shared between neighbouring voxels are only probed once.
     """
     rounded_corner = [round(c, precision) for c in corner]
-    print(f"[DEBUG] Testing corner (rounded to {precision}): {rounded_corner}")
+    if cache is not None:
+        key = tuple(rounded_corner)
+        if key in cache:
+            return cache[key]
+    if debug:
+        print(f"[DEBUG] Testing corner (rounded to {precision}): {rounded_corner}")
+    inside_any = False
     for tag in volume_tags:
         inside = gmsh.model.isInside(3, tag, rounded_corner)
-        print(f"[DEBUG]   Volume tag {tag}: isInside = {inside}")
+        if debug:
+            print(f"[DEBUG]   Volume tag {tag}: isInside = {inside}")
         if inside:
-            return True
-    return False
+            inside_any = True
+            break
+    if cache is not None:
+        cache[key] = inside_any
+    return inside_any
 
-def classify_voxel_by_corners(px, py, pz, resolution, volume_tags):
+def classify_voxel_by_corners(px, py, pz, resolution, volume_tags, precision=None, cache=None, debug=False):
     """
     Classifies a voxel based on its 8 corners:
     - Returns 0 if all corners are inside geometry (solid)
     - Returns 1 if all corners are outside geometry (fluid)
     - Returns -1 if mixed (boundary)
+
+    Callers classifying a whole grid should pass the precomputed
+    `precision` so it is not re-derived from `resolution` per voxel,
+    and a shared `cache` dict so corner probes are reused across voxels.
+    Per-corner diagnostics are printed only when `debug` is set.
     """
-    precision = get_decimal_precision(resolution)
-    print(f"\n[DEBUG] Classifying voxel at center: ({px:.3f}, {py:.3f}, {pz:.3f})")
+    if precision is None:
+        precision = get_decimal_precision(resolution)
+    if debug:
+        print(f"\n[DEBUG] Classifying voxel at center: ({px:.3f}, {py:.3f}, {pz:.3f})")
     half = 0.5 * resolution
     corners = [
         [px - half, py - half, pz - half],  # corner 0
@@ -67,18 +87,22 @@ def classify_voxel_by_corners(px, py, pz, resolution, volume_tags):
 
     statuses = []
     for i, corner in enumerate(corners):
-        result = is_inside_model_geometry(corner, volume_tags, precision)
+        result = is_inside_model_geometry(corner, volume_tags, precision, cache, debug)
         statuses.append(result)
-        print(f"[DEBUG]   Corner {i}: {corner} → inside = {result}")
+        if debug:
+            print(f"[DEBUG]   Corner {i}: {corner} → inside = {result}")
 
     if all(statuses):
-        print("[DEBUG] → Classification: SOLID (0)")
+        if debug:
+            print("[DEBUG] → Classification: SOLID (0)")
         return 0
     elif not any(statuses):
-        print("[DEBUG] → Classification: FLUID (1)")
+        if debug:
+            print("[DEBUG] → Classification: FLUID (1)")
         return 1
     else:
-        print("[DEBUG] → Classification: BOUNDARY (-1)")
+        if debug:
+            print("[DEBUG] → Classification: BOUNDARY (-1)")
         return -1
 
 # Future helpers can be added here:
@@ -7,6 +7,7 @@ from datetime import datetime
 from src.gmsh_core import (
     initialize_gmsh_model,
     compute_bounding_box,
+    get_decimal_precision,
     classify_voxel_by_corners
 )
 
@@ -149,18 +150,22 @@ def extract_geometry_mask(step_path, resolution=None, flow_region="internal", pa
 
         mask = []
         volume_tags = [v[1] for v in volumes]
+        precision = get_decimal_precision(resolution)
+        inside_cache = {}
         if debug:
             print(f"[DEBUG] Volume tags: {volume_tags}")
 
-        for z_idx in range(nz):        # outermost
-            pz = min_z + (z_idx + 0.5) * resolution
-            for y_idx in range(ny):    # middle
-                py = min_y + (y_idx + 0.5) * resolution
-                for x_idx in range(nx):  # innermost (x-major)
-                    px = min_x + (x_idx + 0.5) * resolution
+        # Voxel-center coordinates per axis, computed once rather than per voxel
+        xs = [min_x + (x_idx + 0.5) * resolution for x_idx in range(nx)]
+        ys = [min_y + (y_idx + 0.5) * resolution for y_idx in range(ny)]
+        zs = [min_z + (z_idx + 0.5) * resolution for z_idx in range(nz)]
+
+        for z_idx, pz in enumerate(zs):        # outermost
+            for y_idx, py in enumerate(ys):    # middle
+                for x_idx, px in enumerate(xs):  # innermost (x-major)
                     if debug:
                         print(f"\n[DEBUG] Voxel index: ({x_idx}, {y_idx}, {z_idx}) → center=({px:.3f}, {py:.3f}, {pz:.3f})")
-                    value = classify_voxel_by_corners(px, py, pz, resolution, volume_tags)
+                    value = classify_voxel_by_corners(px, py, pz, resolution, volume_tags, precision, inside_cache, debug)
                     mask.append(value)
 
         result = {
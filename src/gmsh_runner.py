@@ -70,12 +70,14 @@ def main():
         if region_comment:
             print(f"[INFO] Flow region comment: {region_comment}")
 
-        print("[INFO] Final geometry mask:")
-        print(json.dumps(result, indent=2))
+        if args.debug:
+            print("[INFO] Final geometry mask:")
+            print(json.dumps(result, indent=2))
 
         if args.output:
+            # Compact separators: indent=2 puts every mask voxel on its own line
             with open(args.output, "w") as f:
-                json.dump(result, f, indent=2)
+                json.dump(result, f, separators=(",", ":"))
             print(f"[INFO] Geometry mask written to: {args.output}")
 
     except (FileNotFoundError, ValidationError) as e:
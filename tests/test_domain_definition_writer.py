@@ -56,5 +56,14 @@ def test_invalid_logical_bounds(axis, min_val, max_val):
     with pytest.raises(DomainValidationError, match=f"Invalid domain: max_{axis}"):
         validate_domain_bounds(domain)
 
+def test_integer_bounds_reported_as_floats():
+    domain = {
+        "min_x": 0, "max_x": 10,
+        "min_y": 1, "max_y": 5,
+        "min_z": 7, "max_z": 6
+    }
+    with pytest.raises(DomainValidationError, match=r"max_z \(6\.0\) < min_z \(7\.0\)"):
+        validate_domain_bounds(domain)
+
 
 
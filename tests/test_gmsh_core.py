@@ -66,6 +66,19 @@ def test_is_inside_model_geometry_mixed(monkeypatch):
     volume_tags = [101, 102]
     assert is_inside_model_geometry(corner, volume_tags, precision=2) is True
 
+def test_is_inside_model_geometry_uses_cache(monkeypatch):
+    calls = []
+    def mock_is_inside(dim, tag, pt):
+        calls.append(tag)
+        return tag == 102
+    monkeypatch.setattr("gmsh.model.isInside", mock_is_inside)
+    cache = {}
+    corner = [1.23456, 2.34567, 3.45678]
+    assert is_inside_model_geometry(corner, [101, 102], precision=2, cache=cache) is True
+    assert is_inside_model_geometry([1.2301, 2.3499, 3.4551], [101, 102], precision=2, cache=cache) is True
+    assert calls == [101, 102]
+    assert cache == {(1.23, 2.35, 3.46): True}
+
 # --- classify_voxel_by_corners ---
 
 @pytest.mark.parametrize("inside_pattern,expected", [
@@ -82,5 +95,28 @@ def test_classify_voxel_by_corners(monkeypatch, inside_pattern, expected):
     )
     assert result == expected
 
+def test_classify_voxel_by_corners_uses_given_precision(monkeypatch):
+    probed = []
+    def mock_is_inside(dim, tag, pt):
+        probed.append(pt)
+        return True
+    monkeypatch.setattr("gmsh.model.isInside", mock_is_inside)
+    monkeypatch.setattr("src.gmsh_core.get_decimal_precision", mock.Mock(side_effect=AssertionError))
+    result = classify_voxel_by_corners(
+        px=1.0, py=1.0, pz=1.0,
+        resolution=0.25,
+        volume_tags=[101],
+        precision=1
+    )
+    assert result == 0
+    assert probed[0] == [0.9, 0.9, 0.9]
+
+def test_classify_voxel_by_corners_silent_without_debug(monkeypatch, capsys):
+    monkeypatch.setattr("gmsh.model.isInside", lambda dim, tag, pt: False)
+    classify_voxel_by_corners(px=1.0, py=1.0, pz=1.0, resolution=0.5, volume_tags=[101])
+    assert capsys.readouterr().out == ""
+    classify_voxel_by_corners(px=1.0, py=1.0, pz=1.0, resolution=0.5, volume_tags=[101], debug=True)
+    assert "Classification: FLUID (1)" in capsys.readouterr().out
+
 
 